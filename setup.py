@@ -13,12 +13,15 @@ setup(
         "docker==6.1.2",
         "fastapi==0.95.0",
         "uvicorn==0.21.0",
-        "pytest==7.3.1",
-        "pytest-asyncio==0.21.0",
+        "pytest>=8.4",
+        "pytest-asyncio>=1.4.0",
+        "pytest-xdist>=2.5.0",
         "prometheus-client==0.16.0",
         "jinja2==3.1.2",
         "psutil==5.9.0",
         "networkx==3.1",
+        "orjson>=3.6.0",
+        "numpy>=1.21.0",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.11",
 )
@@ -5,6 +5,16 @@ from datetime import datetime
 from dataclasses import dataclass
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
 @dataclass
 class Message:
     topic: str
@@ -30,11 +40,15 @@ class AgentBus:
         self.topics: Dict[str, List[asyncio.Queue]] = {}
         self.subscribers: Dict[str, List[Callable]] = {}
         self.message_history: Dict[str, List[Message]] = {}
+        self._pre_publish_hooks: List[Callable] = []
         self.running = True
 
     async def publish(self, topic: str, message: Dict[str, Any], asl_tags: Dict[str, Any]) -> None:
         """Publish a message to a topic."""
         try:
+            for hook in self._pre_publish_hooks:
+                await hook(topic)
+
             msg = Message(
                 topic=topic,
                 content=message,
@@ -43,7 +57,7 @@ class AgentBus:
             
             # Log the message
             self.logger.info(
-                f"Publishing to topic {topic}: {json.dumps(message)}"
+                f"Publishing to topic {topic}: {_dumps(message)}"
             )
 
             # Store in history
@@ -68,12 +82,55 @@ class AgentBus:
             self.logger.error(f"Error publishing message: {str(e)}")
             raise
 
-    async def subscribe(self, topic: str) -> asyncio.Queue:
-        """Subscribe to a topic and return a queue for messages."""
+    async def publish_many(self, topic: str, messages: List[Dict[str, Any]], asl_tags: Dict[str, Any]) -> None:
+        """Publish a batch of messages to a topic."""
+        try:
+            for hook in self._pre_publish_hooks:
+                await hook(topic)
+
+            msgs = [
+                Message(topic=topic, content=message, asl_tags=asl_tags)
+                for message in messages
+            ]
+            
+            self.logger.info(f"Publishing {len(msgs)} messages to topic {topic}")
+
+            # Store in history
+            if topic not in self.message_history:
+                self.message_history[topic] = []
+            self.message_history[topic].extend(msgs)
+
+            # Deliver to topic queues, only yielding when a bounded queue is full
+            if topic in self.topics:
+                for queue in self.topics[topic]:
+                    for msg in msgs:
+                        try:
+                            queue.put_nowait(msg)
+                        except asyncio.QueueFull:
+                            await queue.put(msg)
+
+            # Notify subscribers
+            if topic in self.subscribers:
+                for callback in self.subscribers[topic]:
+                    for msg in msgs:
+                        try:
+                            await callback(msg)
+                        except Exception as e:
+                            self.logger.error(f"Subscriber callback failed: {str(e)}")
+
+        except Exception as e:
+            self.logger.error(f"Error publishing messages: {str(e)}")
+            raise
+
+    async def subscribe(self, topic: str, maxsize: int = 0) -> asyncio.Queue:
+        """Subscribe to a topic and return a queue for messages.
+
+        A positive maxsize bounds the queue so publishers wait for slow consumers.
+        """
         if topic not in self.topics:
             self.topics[topic] = []
         
-        queue = asyncio.Queue()
+        queue = asyncio.Queue(maxsize=maxsize)
         self.topics[topic].append(queue)
         
         self.logger.info(f"New subscription to topic {topic}")
@@ -86,6 +143,14 @@ class AgentBus:
         self.subscribers[topic].append(callback)
         self.logger.info(f"Added subscriber callback to topic {topic}")
 
+    def add_pre_publish_hook(self, hook: Callable) -> None:
+        """Add an async hook awaited with the topic before every publish call."""
+        self._pre_publish_hooks.append(hook)
+
+    def remove_pre_publish_hook(self, hook: Callable) -> None:
+        """Remove a previously added pre-publish hook."""
+        self._pre_publish_hooks.remove(hook)
+
     def get_history(self, topic: str, limit: Optional[int] = None) -> List[Message]:
         """Get message history for a topic."""
         if topic not in self.message_history:
@@ -61,17 +61,30 @@ class AetheroMonitor:
         }
         self.alert_callbacks: List[callable] = []
         self.running = True
+        self._stop_event = asyncio.Event()
 
     async def start_monitoring(self, interval: int = 60):
         """Start the monitoring loop."""
         self.logger.info("Starting Aethero monitoring system")
         while self.running:
+            delay = interval
             try:
                 await self.collect_metrics()
-                await asyncio.sleep(interval)
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {str(e)}")
-                await asyncio.sleep(5)  # Brief pause before retry
+                delay = 5  # Brief pause before retry
+
+            # Wait for the next cycle, waking immediately if stop() is called
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                continue
+            break
+
+    def stop(self):
+        """Stop the monitoring loop without waiting out the current interval."""
+        self.running = False
+        self._stop_event.set()
 
     async def collect_metrics(self):
         """Collect system and agent metrics."""
@@ -197,7 +210,7 @@ async def main():
     print(json.dumps(agent_metrics, indent=2))
     
     # Stop monitoring
-    monitor.running = False
+    monitor.stop()
     await monitoring_task
 
 if __name__ == "__main__":
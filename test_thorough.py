@@ -5,6 +5,11 @@ from pathlib import Path
 from datetime import datetime, UTC
 from src.asl_parser import ASLParser, ASLTag, create_asl_tag
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 class TestASLParser(unittest.TestCase):
     def setUp(self):
         self.parser = ASLParser()
@@ -66,8 +71,7 @@ class TestAgentConfigurations(unittest.TestCase):
         
         for agent in self.required_agents:
             config_file = self.config_dir / f"{agent}_agent_config.yaml"
-            with open(config_file) as f:
-                config = yaml.safe_load(f)
+            config = yaml.load(config_file.read_bytes(), Loader=SafeLoader)
                 
             for field in required_fields:
                 self.assertIn(field, config, f"{field} missing in {agent} config")
@@ -77,8 +81,7 @@ class TestAgentConfigurations(unittest.TestCase):
         configs = {}
         for agent in self.required_agents:
             config_file = self.config_dir / f"{agent}_agent_config.yaml"
-            with open(config_file) as f:
-                configs[agent] = yaml.safe_load(f)
+            configs[agent] = yaml.load(config_file.read_bytes(), Loader=SafeLoader)
         
         # Test planner-scout relationship
         self.assertIn('scout_agent', configs['planner']['required_agents'])
@@ -140,8 +143,7 @@ class TestCrossComponentIntegration(unittest.TestCase):
             
             # Verify tag structure matches agent config requirements
             config_file = Path("config") / f"{agent}_agent_config.yaml"
-            with open(config_file) as f:
-                config = yaml.safe_load(f)
+            config = yaml.load(config_file.read_bytes(), Loader=SafeLoader)
                 
             # Check if parsed tags match the agent's ASL tag configuration
             config_tags = set(config['asl_tags'])
@@ -0,0 +1,49 @@
+"""
+Shared config loading and helpers for the test suite
+"""
+import json
+import time
+from typing import Dict
+from pathlib import Path
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_yaml(file_path):
+    return yaml.load(Path(file_path).read_bytes(), Loader=SafeLoader)
+
+def load_json(file_path):
+    data = Path(file_path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def load_config(file_path):
+    """Parse a YAML or JSON config file, dispatching on its extension"""
+    if Path(file_path).suffix in {'.yaml', '.yml'}:
+        return load_yaml(file_path)
+    return load_json(file_path)
+
+def epoch_ns_str(_t=time.time_ns) -> str:
+    """Epoch timestamp as 'seconds.nanoseconds', without going through datetime"""
+    ns = _t()
+    return f"{ns // 1_000_000_000}.{ns % 1_000_000_000:09d}"
+
+# One payload per size, shared by every message of that size
+_PAYLOAD_CACHE: Dict[int, str] = {}
+
+def cached_payload(nbytes: int) -> str:
+    """Return an nbytes-long filler string, building it only once per size"""
+    data = _PAYLOAD_CACHE.get(nbytes)
+    if data is None:
+        data = _PAYLOAD_CACHE[nbytes] = "x" * nbytes
+    return data
@@ -1,7 +1,19 @@
 import pytest
+import asyncio
 import logging
 from src.agents.agent_bus import AgentBus
 
+if hasattr(asyncio, "eager_task_factory"):
+    def _eager_event_loop():
+        """New event loop whose tasks start eagerly"""
+        loop = asyncio.new_event_loop()
+        loop.set_task_factory(asyncio.eager_task_factory)
+        return loop
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Let coroutines that finish without suspending skip the scheduler"""
+        return {"eager": _eager_event_loop}
+
 @pytest.fixture
 def agent_bus():
     """Fixture to provide a configured AgentBus instance"""
@@ -2,7 +2,6 @@
 Tests for Aethero_Mem API and Schema Validation
 """
 import pytest
-import yaml
 from pathlib import Path
 import json
 import jsonschema
@@ -14,12 +13,23 @@ pytestmark = pytest.mark.skip(reason="aiohttp not supported on Python 3.13")
 import asyncio
 from typing import Dict, Any
 
+from tests._io import load_yaml
+
 # Load schema configuration
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mem_schema():
     schema_path = Path("../memory/aethero_mem_schema.yaml")
-    with open(schema_path) as f:
-        return yaml.safe_load(f)
+    return load_yaml(schema_path)
+
+@pytest.fixture(scope="session")
+def schema_validators(mem_schema):
+    """Check and build each schema's validator once per session instead of on every validate call"""
+    validators = {}
+    for name in ("agent_state", "decision_record", "reflection_result"):
+        schema = mem_schema["schemas"][name]
+        jsonschema.Draft7Validator.check_schema(schema)
+        validators[name] = jsonschema.Draft7Validator(schema)
+    return validators
 
 # Test data fixtures
 @pytest.fixture
@@ -93,20 +103,17 @@ def sample_reflection_result():
     }
 
 # Schema Validation Tests
-def test_agent_state_schema(mem_schema, sample_agent_state):
+def test_agent_state_schema(schema_validators, sample_agent_state):
     """Test agent state schema validation"""
-    schema = mem_schema["schemas"]["agent_state"]
-    jsonschema.validate(instance=sample_agent_state, schema=schema)
+    assert not list(schema_validators["agent_state"].iter_errors(sample_agent_state))
 
-def test_decision_record_schema(mem_schema, sample_decision_record):
+def test_decision_record_schema(schema_validators, sample_decision_record):
     """Test decision record schema validation"""
-    schema = mem_schema["schemas"]["decision_record"]
-    jsonschema.validate(instance=sample_decision_record, schema=schema)
+    assert not list(schema_validators["decision_record"].iter_errors(sample_decision_record))
 
-def test_reflection_result_schema(mem_schema, sample_reflection_result):
+def test_reflection_result_schema(schema_validators, sample_reflection_result):
     """Test reflection result schema validation"""
-    schema = mem_schema["schemas"]["reflection_result"]
-    jsonschema.validate(instance=sample_reflection_result, schema=schema)
+    assert not list(schema_validators["reflection_result"].iter_errors(sample_reflection_result))
 
 # API Endpoint Tests
 @pytest.mark.asyncio
@@ -0,0 +1,87 @@
+"""
+Tests for AgentBus delivery behaviour
+"""
+import asyncio
+import json
+
+import pytest
+
+import src.agents.agent_bus as agent_bus_module
+from src.agents.agent_bus import AgentBus
+
+@pytest.mark.asyncio
+async def test_pre_publish_hook_runs_before_delivery(agent_bus: AgentBus):
+    """Hooks are awaited with the topic before the message reaches subscribers"""
+    queue = await agent_bus.subscribe("hooked")
+    calls = []
+
+    async def hook(topic: str):
+        calls.append((topic, queue.qsize()))
+
+    agent_bus.add_pre_publish_hook(hook)
+    await agent_bus.publish(topic="hooked", message={"n": 1}, asl_tags={})
+    await agent_bus.publish_many(topic="hooked", messages=[{"n": 2}, {"n": 3}], asl_tags={})
+
+    # Nothing had been delivered yet when each publish call ran its hook
+    assert calls == [("hooked", 0), ("hooked", 1)]
+    assert queue.qsize() == 3
+
+@pytest.mark.asyncio
+async def test_remove_pre_publish_hook(agent_bus: AgentBus):
+    """A removed hook is no longer called"""
+    calls = []
+
+    async def hook(topic: str):
+        calls.append(topic)
+
+    agent_bus.add_pre_publish_hook(hook)
+    await agent_bus.publish(topic="hooked", message={"n": 1}, asl_tags={})
+    agent_bus.remove_pre_publish_hook(hook)
+    await agent_bus.publish(topic="hooked", message={"n": 2}, asl_tags={})
+
+    assert calls == ["hooked"]
+    assert len(agent_bus.get_history("hooked")) == 2
+
+@pytest.mark.asyncio
+async def test_publish_many_preserves_order_and_history(agent_bus: AgentBus):
+    """A batch is recorded and delivered in the order it was given"""
+    queue = await agent_bus.subscribe("batch")
+    await agent_bus.publish(topic="batch", message={"n": 0}, asl_tags={})
+    await agent_bus.publish_many(
+        topic="batch",
+        messages=[{"n": i} for i in range(1, 4)],
+        asl_tags={"test": "batch"}
+    )
+
+    history = agent_bus.get_history("batch")
+    assert [m.content["n"] for m in history] == [0, 1, 2, 3]
+    assert all(m.asl_tags == {"test": "batch"} for m in history[1:])
+    assert [queue.get_nowait().content["n"] for _ in range(4)] == [0, 1, 2, 3]
+
+@pytest.mark.asyncio
+async def test_publish_many_waits_on_bounded_subscriber(agent_bus: AgentBus):
+    """A full maxsize=1 queue makes publish_many wait for the consumer"""
+    queue = await agent_bus.subscribe("bounded", maxsize=1)
+    publisher = asyncio.create_task(
+        agent_bus.publish_many(topic="bounded", messages=[{"n": i} for i in range(3)], asl_tags={})
+    )
+    await asyncio.sleep(0)
+
+    # The whole batch is in history, but only one message fits in the queue
+    assert not publisher.done()
+    assert queue.full()
+    assert len(agent_bus.get_history("bounded")) == 3
+
+    received = [(await queue.get()).content["n"] for _ in range(3)]
+    await asyncio.wait_for(publisher, timeout=1)
+    assert received == [0, 1, 2]
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_fallback(monkeypatch, use_orjson: bool):
+    """Log serialisation gives the same JSON with or without orjson"""
+    if use_orjson and agent_bus_module.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(agent_bus_module, "orjson", None)
+    payload = {"data": "x", "sequence": 1, "nested": {"ok": True}}
+    assert json.loads(agent_bus_module._dumps(payload)) == payload
@@ -2,41 +2,62 @@
 Tests for CI/CD Pipeline Configuration
 """
 import pytest
-import yaml
 from pathlib import Path
 import json
 import re
 
-def load_yaml(file_path):
-    with open(file_path) as f:
-        return yaml.safe_load(f)
+from tests._io import load_yaml
 
-def test_github_workflow_structure():
+REPO_ROOT = Path(__file__).resolve().parents[1]
+WORKFLOW_PATH = REPO_ROOT / '.github/workflows/aetheros_ci.yml'
+
+pytestmark = pytest.mark.skipif(not WORKFLOW_PATH.exists(), reason="workflow file not present")
+
+def find_all(text, needles):
+    """Return the subset of needles found in text, including overlapping or nested ones"""
+    return {needle for needle in needles if needle in text}
+
+@pytest.fixture(scope="session")
+def ci_workflow():
+    """Parse the CI workflow once for the whole module"""
+    return load_yaml(WORKFLOW_PATH)
+
+@pytest.fixture(scope="session")
+def steps_by_name(ci_workflow):
+    """Index every job's steps by name so lookups don't rescan the step list"""
+    return {
+        job_name: {step.get('name', ''): step for step in job['steps']}
+        for job_name, job in ci_workflow['jobs'].items()
+    }
+
+def find_step(steps, name):
+    """Look up a step by exact name, falling back to the first step whose name contains it"""
+    step = steps.get(name)
+    if step is None:
+        step = next((candidate for step_name, candidate in steps.items() if name in step_name), None)
+    if step is None:
+        raise KeyError(f"no step named {name!r}")
+    return step
+
+def test_github_workflow_structure(ci_workflow):
     """Test GitHub Actions workflow configuration"""
-    workflow = load_yaml('../.github/workflows/aetheros_ci.yml')
-    
     # Verify required jobs
     required_jobs = ['test', 'validate-schemas', 'build-docs', 'deploy', 'monitoring']
-    assert all(job in workflow['jobs'] for job in required_jobs)
+    assert set(required_jobs) <= ci_workflow['jobs'].keys()
     
     # Verify job dependencies
-    deploy_job = workflow['jobs']['deploy']
+    deploy_job = ci_workflow['jobs']['deploy']
     assert 'needs' in deploy_job
-    assert all(need in ['test', 'validate-schemas', 'build-docs'] 
-              for need in deploy_job['needs'])
+    assert set(deploy_job['needs']) <= {'test', 'validate-schemas', 'build-docs'}
     
     # Verify conditional deployment
     assert 'if' in deploy_job
     assert 'github.ref == \'refs/heads/main\'' in deploy_job['if']
 
-def test_release_artifact_structure():
+def test_release_artifact_structure(steps_by_name):
     """Test release artifact packaging"""
-    workflow = load_yaml('../.github/workflows/aetheros_ci.yml')
-    deploy_job = workflow['jobs']['deploy']
-    
     # Find package step
-    package_step = next(step for step in deploy_job['steps'] 
-                       if 'Package components' in step.get('name', ''))
+    package_step = find_step(steps_by_name['deploy'], 'Package components')
     
     # Verify required components are included
     package_command = package_step['run']
@@ -47,30 +68,24 @@ def test_release_artifact_structure():
         'memory/',
         'tests/'
     ]
-    assert all(component in package_command for component in required_components)
+    assert find_all(package_command, required_components) == set(required_components)
 
-def test_monitoring_setup():
+def test_monitoring_setup(ci_workflow, steps_by_name):
     """Test monitoring job configuration"""
-    workflow = load_yaml('../.github/workflows/aetheros_ci.yml')
-    monitoring_job = workflow['jobs']['monitoring']
+    monitoring_job = ci_workflow['jobs']['monitoring']
     
     # Verify monitoring steps
-    step_names = [step.get('name', '') for step in monitoring_job['steps']]
     required_steps = ['Configure Prometheus', 'Configure Grafana', 'Setup Alerts']
-    assert all(step in step_names for step in required_steps)
+    assert set(required_steps) <= steps_by_name['monitoring'].keys()
     
     # Verify job dependencies
     assert 'needs' in monitoring_job
     assert 'deploy' in monitoring_job['needs']
 
-def test_test_job_coverage():
+def test_test_job_coverage(steps_by_name):
     """Test coverage of test job"""
-    workflow = load_yaml('../.github/workflows/aetheros_ci.yml')
-    test_job = workflow['jobs']['test']
-    
     # Find test execution step
-    test_step = next(step for step in test_job['steps'] 
-                    if 'Run tests' in step.get('name', ''))
+    test_step = find_step(steps_by_name['test'], 'Run tests')
     
     # Verify all test files are included
     test_command = test_step['run']
@@ -79,16 +94,12 @@ def test_test_job_coverage():
         'test_langgraph_visualization.py',
         'test_aethero_mem_api.py'
     ]
-    assert all(test in test_command for test in required_tests)
+    assert find_all(test_command, required_tests) == set(required_tests)
 
-def test_schema_validation_job():
+def test_schema_validation_job(steps_by_name):
     """Test schema validation job configuration"""
-    workflow = load_yaml('../.github/workflows/aetheros_ci.yml')
-    validate_job = workflow['jobs']['validate-schemas']
-    
     # Find validation step
-    validate_step = next(step for step in validate_job['steps'] 
-                        if 'Validate YAML schemas' in step.get('name', ''))
+    validate_step = find_step(steps_by_name['validate-schemas'], 'Validate YAML schemas')
     
     # Verify all schemas are validated
     validation_script = validate_step['run']
@@ -97,22 +108,17 @@ def test_schema_validation_job():
         'deep_eval_config.yaml',
         'aethero_mem_schema.yaml'
     ]
-    assert all(schema in validation_script for schema in required_schemas)
+    assert find_all(validation_script, required_schemas) == set(required_schemas)
 
-def test_documentation_build():
+def test_documentation_build(steps_by_name):
     """Test documentation build job"""
-    workflow = load_yaml('../.github/workflows/aetheros_ci.yml')
-    docs_job = workflow['jobs']['build-docs']
-    
     # Verify mkdocs installation
-    install_step = next(step for step in docs_job['steps'] 
-                       if 'Install dependencies' in step.get('name', ''))
+    install_step = find_step(steps_by_name['build-docs'], 'Install dependencies')
     assert 'mkdocs' in install_step['run']
     assert 'mkdocs-material' in install_step['run']
     
     # Verify build step
-    build_step = next(step for step in docs_job['steps'] 
-                     if 'Build documentation' in step.get('name', ''))
+    build_step = find_step(steps_by_name['build-docs'], 'Build documentation')
     assert 'mkdocs build' in build_step['run']
 
 if __name__ == '__main__':
@@ -0,0 +1,13 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.skipif(
+    not hasattr(asyncio, "eager_task_factory"),
+    reason="asyncio.eager_task_factory requires Python 3.12+",
+)
+@pytest.mark.asyncio
+async def test_eager_task_factory_installed():
+    """Test loops are created with the eager task factory"""
+    assert asyncio.get_running_loop().get_task_factory() is asyncio.eager_task_factory
@@ -2,10 +2,16 @@ import asyncio
 import logging
 import aiohttp
 import json
+import pytest
+import pytest_asyncio
 from abc import ABC, abstractmethod
+from time import time_ns
 from typing import Dict, Any, List
 import sys
 import os
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aioresponses import aioresponses
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -13,6 +19,30 @@ from src.agents.aethero_agent_bootstrap import BaseAetheroAgent
 from src.agents.agent_bus import AgentBus
 from src.monitoring.monitor import AetheroMonitor
 
+logger = logging.getLogger("integration_test")
+
+@pytest.fixture(scope="module")
+def agent_bus() -> AgentBus:
+    """Bus shared by the integration tests in this module"""
+    return AgentBus()
+
+# Simulated plugin setup/teardown latency; off unless explicitly requested
+SIM_LATENCY = int(os.environ.get("AETHEROS_SIM_LATENCY_MS", "0")) / 1000
+
+REST_API_URL = "https://api.example.com/v1"
+
+# Share one loop across the module so pooled REST sessions outlive single tests
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+async def ws_echo_handler(request: web.Request) -> web.WebSocketResponse:
+    """In-process WebSocket endpoint that echoes every text frame back"""
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    async for msg in ws:
+        if msg.type == aiohttp.WSMsgType.TEXT:
+            await ws.send_str(msg.data)
+    return ws
+
 class ExternalConnector(ABC):
     """Base class for external system connectors"""
     
@@ -39,17 +69,47 @@ class ExternalConnector(ABC):
 class RESTConnector(ExternalConnector):
     """Connector for REST API integration"""
     
+    # Pooled sessions shared by connectors with the same headers on the same loop
+    _sessions: Dict[Any, aiohttp.ClientSession] = {}
+    
     def __init__(self, base_url: str, headers: Dict[str, str] = None):
         self.base_url = base_url
         self.headers = headers or {}
         self.session = None
     
+    @classmethod
+    def _get_session(cls, headers: Dict[str, str]) -> aiohttp.ClientSession:
+        """Return a keep-alive session for these headers, creating it on first use"""
+        key = (asyncio.get_running_loop(), frozenset(headers.items()))
+        session = cls._sessions.get(key)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=5, connect=2),
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                )
+            )
+            cls._sessions[key] = session
+        return session
+    
+    @classmethod
+    async def close_sessions(cls):
+        """Close every pooled session"""
+        sessions, cls._sessions = cls._sessions, {}
+        for session in sessions.values():
+            if not session.closed:
+                await session.close()
+    
     async def connect(self):
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        self.session = self._get_session(self.headers)
     
     async def disconnect(self):
-        if self.session:
-            await self.session.close()
+        # The pooled session outlives this connector; see close_sessions()
+        self.session = None
     
     async def send_data(self, data: Dict[str, Any]):
         if not self.session:
@@ -99,6 +159,9 @@ class WebSocketConnector(ExternalConnector):
 class PluginInterface(ABC):
     """Interface for custom plugins"""
     
+    # Plugins that don't read each other's output may be run concurrently
+    parallel: bool = False
+    
     @abstractmethod
     async def initialize(self):
         """Initialize plugin"""
@@ -123,7 +186,8 @@ class CustomPlugin(PluginInterface):
     
     async def initialize(self):
         # Simulate plugin initialization
-        await asyncio.sleep(0.1)
+        if SIM_LATENCY:
+            await asyncio.sleep(SIM_LATENCY)
         self.initialized = True
     
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -132,13 +196,14 @@ class CustomPlugin(PluginInterface):
         
         # Add plugin-specific processing
         data["processed_by"] = "custom_plugin"
-        data["timestamp"] = str(datetime.now())
+        data["timestamp_ns"] = time_ns()
         
         return data
     
     async def cleanup(self):
         # Simulate cleanup
-        await asyncio.sleep(0.1)
+        if SIM_LATENCY:
+            await asyncio.sleep(SIM_LATENCY)
         self.initialized = False
 
 class IntegrationAgent(BaseAetheroAgent):
@@ -155,11 +220,26 @@ class IntegrationAgent(BaseAetheroAgent):
         await plugin.initialize()
         self.plugins.append(plugin)
     
+    async def add_plugins(self, plugins: List[PluginInterface]):
+        """Add and initialize several plugins concurrently"""
+        await asyncio.gather(*[plugin.initialize() for plugin in plugins])
+        self.plugins.extend(plugins)
+    
     async def process_task(self, task_data: Dict[str, Any], asl_context: Dict[str, Any]) -> Dict[str, Any]:
         """Process task with external system integration"""
-        # Process through plugins
+        # Process through sequential plugins in order
+        parallel_plugins = [p for p in self.plugins if p.parallel]
         for plugin in self.plugins:
-            task_data = await plugin.process(task_data)
+            if not plugin.parallel:
+                task_data = await plugin.process(task_data)
+        
+        # Independent plugins each get their own copy; merge their outputs back in order
+        if parallel_plugins:
+            results = await asyncio.gather(
+                *[plugin.process(dict(task_data)) for plugin in parallel_plugins]
+            )
+            for result in results:
+                task_data.update(result)
         
         # Send to external system
         await self.connector.send_data(task_data)
@@ -174,14 +254,17 @@ class IntegrationAgent(BaseAetheroAgent):
             "asl_context": asl_context
         }
 
-async def test_rest_integration():
+@pytest_asyncio.fixture(scope="module", loop_scope="module", autouse=True)
+async def rest_sessions():
+    """Close the pooled REST sessions once the module's tests are done"""
+    yield
+    await RESTConnector.close_sessions()
+
+async def test_rest_integration(agent_bus: AgentBus):
     """Test REST API integration"""
-    logger = logging.getLogger("integration_test")
-    agent_bus = AgentBus()
-    
-    # Setup REST connector with mock API
+    # Setup REST connector with mock API; no connect() bootstrap, send_data/receive_data connect lazily
     connector = RESTConnector(
-        base_url="https://api.example.com/v1",
+        base_url=REST_API_URL,
         headers={"Authorization": "Bearer test_token"}
     )
     
@@ -205,7 +288,11 @@ async def test_rest_integration():
             "data": {"key": "value"}
         }
         
-        result = await agent.execute_task(task_data, {})
+        # Serve the API in-process; local URLs pass through for the concurrent WebSocket test
+        with aioresponses(passthrough=["http://127.0.0.1"]) as mocked:
+            mocked.post(REST_API_URL, payload={"ok": True})
+            mocked.get(REST_API_URL, payload={"ok": True})
+            result = await agent.execute_task(task_data, {})
         logger.info(f"REST integration result: {result}")
         
     finally:
@@ -213,13 +300,16 @@ async def test_rest_integration():
         for plugin in agent.plugins:
             await plugin.cleanup()
 
-async def test_websocket_integration():
+async def test_websocket_integration(agent_bus: AgentBus):
     """Test WebSocket integration"""
-    logger = logging.getLogger("integration_test")
-    agent_bus = AgentBus()
+    # Serve an echo endpoint on an ephemeral local port
+    app = web.Application()
+    app.router.add_get("/ws", ws_echo_handler)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
     
-    # Setup WebSocket connector
-    connector = WebSocketConnector("ws://example.com/ws")
+    # Setup WebSocket connector; like the REST one, it connects on first send/receive
+    connector = WebSocketConnector(str(server.make_url("/ws")))
     
     # Create integration agent
     agent = IntegrationAgent(
@@ -243,12 +333,10 @@ async def test_websocket_integration():
         
     finally:
         await connector.disconnect()
+        await server.close()
 
-async def test_plugin_system():
+async def test_plugin_system(agent_bus: AgentBus):
     """Test custom plugin architecture"""
-    logger = logging.getLogger("integration_test")
-    agent_bus = AgentBus()
-    
     # Setup mock connector
     class MockConnector(ExternalConnector):
         async def connect(self): pass
@@ -272,8 +360,7 @@ async def test_plugin_system():
             CustomPlugin({"name": "plugin_2"})
         ]
         
-        for plugin in plugins:
-            await agent.add_plugin(plugin)
+        await agent.add_plugins(plugins)
         
         # Test task processing through plugins
         task_data = {
@@ -291,28 +378,34 @@ async def test_plugin_system():
 async def run_integration_tests():
     """Run all integration tests"""
     logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger("integration_tests")
     
     try:
         logger.info("Starting integration testing suite...")
         
-        # Test REST integration
-        logger.info("\nTesting REST API integration...")
-        await test_rest_integration()
+        # REST, WebSocket and plugin tests are independent, so run them concurrently
+        logger.info("\nTesting REST API, WebSocket and plugin integrations...")
+        agent_bus = AgentBus()
+        results = await asyncio.gather(
+            test_rest_integration(agent_bus),
+            test_websocket_integration(agent_bus),
+            test_plugin_system(agent_bus),
+            return_exceptions=True
+        )
         
-        # Test WebSocket integration
-        logger.info("\nTesting WebSocket integration...")
-        await test_websocket_integration()
-        
-        # Test plugin system
-        logger.info("\nTesting plugin architecture...")
-        await test_plugin_system()
+        names = ("REST API integration", "WebSocket integration", "plugin architecture")
+        errors = [(name, r) for name, r in zip(names, results) if isinstance(r, Exception)]
+        for name, error in errors:
+            logger.error(f"{name} failed: {str(error)}")
+        if errors:
+            raise errors[0][1]
         
         logger.info("\nAll integration tests completed successfully!")
         
     except Exception as e:
         logger.error(f"Error in integration testing: {str(e)}")
         raise
+    finally:
+        await RESTConnector.close_sessions()
 
 if __name__ == "__main__":
     asyncio.run(run_integration_tests())
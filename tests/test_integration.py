@@ -3,6 +3,8 @@ import logging
 from datetime import datetime
 from typing import Dict, Any
 
+import pytest
+
 # Import our components
 import sys
 import os
@@ -13,6 +15,18 @@ from src.agents.error_handler import ErrorHandler, ErrorContext
 from src.agents.agent_bus import AgentBus, Message
 from src.monitoring.monitor import AetheroMonitor
 
+logger = logging.getLogger("integration_test")
+
+@pytest.fixture(scope="module")
+def error_handler() -> ErrorHandler:
+    """Error handler shared by the tests in this module"""
+    return ErrorHandler()
+
+@pytest.fixture(scope="module")
+def agent_bus() -> AgentBus:
+    """Agent bus shared by the tests in this module"""
+    return AgentBus()
+
 class TestAgent(BaseAetheroAgent):
     async def process_task(self, task_data: Dict[str, Any], asl_context: Dict[str, Any]) -> Dict[str, Any]:
         self.logger.info(f"Processing task: {task_data}")
@@ -30,14 +44,12 @@ class TestAgent(BaseAetheroAgent):
             "asl_context": asl_context
         }
 
-async def test_integration():
+@pytest.mark.asyncio
+async def test_integration(error_handler: ErrorHandler, agent_bus: AgentBus):
     # Configure logging
     logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger("integration_test")
     
     # Initialize components
-    error_handler = ErrorHandler()
-    agent_bus = AgentBus()
     monitor = AetheroMonitor()
     
     # Create test agent
@@ -118,8 +130,8 @@ async def test_integration():
         
     finally:
         # Cleanup
-        monitor.running = False
+        monitor.stop()
         await monitor_task
         
 if __name__ == "__main__":
-    asyncio.run(test_integration())
+    asyncio.run(test_integration(ErrorHandler(), AgentBus()))
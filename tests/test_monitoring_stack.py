@@ -2,24 +2,32 @@
 Tests for Monitoring Stack Configuration (Prometheus, Grafana, Alerting)
 """
 import pytest
-import yaml
-import json
 from pathlib import Path
 import re
+import sys
+import os
 
-def load_yaml(file_path):
-    with open(file_path) as f:
-        return yaml.safe_load(f)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-def load_json(file_path):
-    with open(file_path) as f:
-        return json.load(f)
+from tests._io import load_config
 
-class TestPrometheusConfig:
-    @pytest.fixture
-    def prometheus_config(self):
-        return load_yaml('../monitoring/prometheus.yml')
+_METRIC_NAME_RE = re.compile(r'[a-zA-Z_:][a-zA-Z0-9_:]*')
+# Metric name immediately followed by a label selector, e.g. foo_total{job="x"}
+_METRIC_RE = re.compile(_METRIC_NAME_RE.pattern + r'(?=\{)')
+
+@pytest.fixture(scope="module")
+def prometheus_config():
+    return load_config('../monitoring/prometheus.yml')
+
+@pytest.fixture(scope="module")
+def dashboard_config():
+    return load_config('../monitoring/grafana_dashboards.json')
+
+@pytest.fixture(scope="module")
+def rules_config():
+    return load_config('../monitoring/aetheros_rules.yml')
 
+class TestPrometheusConfig:
     def test_global_config(self, prometheus_config):
         """Test Prometheus global configuration"""
         global_config = prometheus_config['global']
@@ -59,10 +67,6 @@ class TestPrometheusConfig:
         assert 'aetheros_rules.yml' in prometheus_config['rule_files']
 
 class TestGrafanaDashboards:
-    @pytest.fixture
-    def dashboard_config(self):
-        return load_json('../monitoring/grafana_dashboards.json')
-
     def test_dashboard_structure(self, dashboard_config):
         """Test Grafana dashboard structure"""
         assert 'panels' in dashboard_config
@@ -98,10 +102,6 @@ class TestGrafanaDashboards:
         assert dashboard_config['refresh'] == '5s'
 
 class TestAlertingRules:
-    @pytest.fixture
-    def rules_config(self):
-        return load_yaml('../monitoring/aetheros_rules.yml')
-
     def test_rules_structure(self, rules_config):
         """Test alerting rules structure"""
         assert 'groups' in rules_config
@@ -149,14 +149,10 @@ class TestAlertingRules:
                     assert isinstance(expr, (str, float, int))
                     if isinstance(expr, str):
                         # Basic PromQL syntax check
-                        assert re.search(r'[a-zA-Z_:][a-zA-Z0-9_:]*', expr)
+                        assert _METRIC_NAME_RE.search(expr)
 
-def test_monitoring_integration():
+def test_monitoring_integration(prometheus_config, rules_config, dashboard_config):
     """Test monitoring component integration"""
-    prometheus_config = load_yaml('../monitoring/prometheus.yml')
-    rules_config = load_yaml('../monitoring/aetheros_rules.yml')
-    dashboard_config = load_json('../monitoring/grafana_dashboards.json')
-    
     # Verify metrics consistency
     metrics = set()
     
@@ -165,8 +161,7 @@ def test_monitoring_integration():
         for rule in group['rules']:
             if 'expr' in rule:
                 # Extract metric names from PromQL expressions
-                matches = re.findall(r'[a-zA-Z_:][a-zA-Z0-9_:]*{', rule['expr'])
-                metrics.update(match[:-1] for match in matches)
+                metrics.update(_METRIC_RE.findall(rule['expr']))
     
     # Verify metrics are scraped
     for scrape_config in prometheus_config['scrape_configs']:
@@ -185,8 +180,7 @@ def test_monitoring_integration():
                     for target in sub_panel['targets']:
                         if 'expr' in target:
                             # Extract metric names from panel queries
-                            matches = re.findall(r'[a-zA-Z_:][a-zA-Z0-9_:]*{', target['expr'])
-                            panel_metrics = {match[:-1] for match in matches}
+                            panel_metrics = set(_METRIC_RE.findall(target['expr']))
                             assert panel_metrics.issubset(metrics)
 
 if __name__ == '__main__':
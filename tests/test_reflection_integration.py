@@ -2,32 +2,39 @@
 Integration Tests for ReflectionAgent and DeepEval
 """
 import pytest
+import pytest_asyncio
 import asyncio
 from typing import Dict, Any
 from pathlib import Path
-import yaml
 
 from ..reflection.reflection_agent import ReflectionAgent, ValidationStatus, ReflectionMetrics
 from unittest.mock import Mock, AsyncMock
 
+from tests._io import load_yaml
+
+# Run every test on the module loop that owns the shared reflection_agent
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 # Load configurations
-@pytest.fixture
+@pytest.fixture(scope="module")
 def agent_config():
-    config_path = Path("../aetheroos_sovereign_agent_stack_v1.0.yaml")
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    return load_yaml(Path("../aetheroos_sovereign_agent_stack_v1.0.yaml"))
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def deep_eval_config():
-    config_path = Path("../reflection/deep_eval_config.yaml")
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    return load_yaml(Path("../reflection/deep_eval_config.yaml"))
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def reflection_agent(agent_config):
+    # Set up once per module; tests must not leave state behind on the agent
     agent = ReflectionAgent(agent_config)
     await agent.setup()
-    return agent
+    try:
+        yield agent
+    finally:
+        close = getattr(agent, "close", None)
+        if close is not None:
+            await close()
 
 # Mock DeepEval responses
 @pytest.fixture
@@ -44,17 +51,15 @@ def mock_deep_eval():
     )
 
 # Test Cases
-@pytest.mark.asyncio
 async def test_reflection_agent_setup(reflection_agent):
     """Test ReflectionAgent initialization and setup"""
     assert reflection_agent.config is not None
     assert reflection_agent.aethero_mem is not None
     assert reflection_agent.deep_eval is not None
 
-@pytest.mark.asyncio
-async def test_validate_output(reflection_agent, mock_deep_eval):
+async def test_validate_output(reflection_agent, mock_deep_eval, monkeypatch):
     """Test output validation with DeepEval"""
-    reflection_agent.deep_eval = mock_deep_eval
+    monkeypatch.setattr(reflection_agent, "deep_eval", mock_deep_eval)
     
     test_output = {
         "result": "test_result",
@@ -77,7 +82,6 @@ async def test_validate_output(reflection_agent, mock_deep_eval):
     assert len(result.findings) > 0
     assert len(result.suggestions) > 0
 
-@pytest.mark.asyncio
 async def test_reflection_on_pipeline(reflection_agent):
     """Test pipeline reflection process"""
     result = await reflection_agent.reflect_on_pipeline(
@@ -88,7 +92,6 @@ async def test_reflection_on_pipeline(reflection_agent):
     assert "performance_analysis" in result
     assert "recommendations" in result
 
-@pytest.mark.asyncio
 async def test_deep_eval_integration(reflection_agent, deep_eval_config):
     """Test DeepEval integration with custom criteria"""
     test_output = {
@@ -108,7 +111,6 @@ async def test_deep_eval_integration(reflection_agent, deep_eval_config):
     assert result.metrics.consistency >= criteria["consistency"]["thresholds"]["low"]
     assert result.metrics.ethical_compliance >= criteria["ethical_compliance"]["thresholds"]["low"]
 
-@pytest.mark.asyncio
 async def test_aethero_mem_logging(reflection_agent):
     """Test logging reflection results to Aethero_Mem"""
     metrics = ReflectionMetrics(
@@ -139,7 +141,6 @@ async def test_aethero_mem_logging(reflection_agent):
     assert logged_data["findings"] == findings
     assert logged_data["suggestions"] == suggestions
 
-@pytest.mark.asyncio
 async def test_error_handling(reflection_agent):
     """Test error handling in reflection process"""
     # Test with invalid output
@@ -157,7 +158,6 @@ async def test_error_handling(reflection_agent):
         )
 
 # Performance Tests
-@pytest.mark.asyncio
 async def test_reflection_performance(reflection_agent):
     """Test reflection process performance"""
     import time
@@ -165,17 +165,19 @@ async def test_reflection_performance(reflection_agent):
     start_time = time.time()
     
     # Perform multiple validations
-    tasks = []
-    for i in range(10):
-        tasks.append(
-            reflection_agent.validate_output(
-                agent_id=f"test_agent_{i}",
-                output={"result": f"test_{i}"},
-                context={"iteration": i}
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(
+                reflection_agent.validate_output(
+                    agent_id=f"test_agent_{i}",
+                    output={"result": f"test_{i}"},
+                    context={"iteration": i}
+                )
             )
-        )
+            for i in range(10)
+        ]
     
-    results = await asyncio.gather(*tasks)
+    results = [t.result() for t in tasks]
     
     end_time = time.time()
     duration = end_time - start_time
@@ -1,11 +1,15 @@
 import asyncio
+import base64
+import hashlib
+import hmac
 import logging
 import jwt
 import ssl
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 from cryptography.fernet import Fernet
+import orjson
 from dataclasses import dataclass
 
 import sys
@@ -22,6 +26,15 @@ TEST_JWT_SECRET = "test_jwt_secret"
 SSL_CERT_PATH = "./tests/certs/test_cert.pem"
 SSL_KEY_PATH = "./tests/certs/test_key.pem"
 
+_FERNET = Fernet(TEST_SECRET_KEY)
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# HS256 key material prepared once; each token signs a copy so its exp stays fresh
+_JWT_HEADER = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+_SIGNER = hmac.new(TEST_JWT_SECRET.encode(), digestmod=hashlib.sha256)
+
 @dataclass
 class SecurityContext:
     """Security context for testing authentication and authorization"""
@@ -37,42 +50,53 @@ class SecureAgent(BaseAetheroAgent):
                  agent_bus: AgentBus, security_context: SecurityContext):
         super().__init__(agent_id, config, logger, agent_bus)
         self.security_context = security_context
-        self.encryption_key = Fernet(TEST_SECRET_KEY)
+        self._granted_perms = frozenset(security_context.permissions)
+        self.encryption_key = _FERNET
     
     async def process_task(self, task_data: Dict[str, Any], asl_context: Dict[str, Any]) -> Dict[str, Any]:
         """Process task with security checks"""
         if not self._verify_permissions(task_data.get("required_permissions", [])):
             raise PermissionError("Insufficient permissions")
             
-        # Encrypt sensitive data
+        # Encrypt sensitive data; the token stays a str so the result remains JSON-serialisable
         if "sensitive_data" in task_data:
-            task_data["sensitive_data"] = self._encrypt_data(task_data["sensitive_data"])
+            task_data["sensitive_data"] = self._encrypt_data(task_data["sensitive_data"].encode()).decode()
             
         return await super().process_task(task_data, asl_context)
     
     def _verify_permissions(self, required_permissions: list) -> bool:
         """Verify agent has required permissions"""
-        return all(perm in self.security_context.permissions for perm in required_permissions)
+        return self._granted_perms.issuperset(required_permissions)
     
-    def _encrypt_data(self, data: str) -> str:
+    def _encrypt_data(self, data: bytes) -> bytes:
         """Encrypt sensitive data"""
-        return self.encryption_key.encrypt(data.encode()).decode()
+        return _FERNET.encrypt(data)
     
-    def _decrypt_data(self, encrypted_data: str) -> str:
+    def _decrypt_data(self, encrypted_data: bytes) -> bytes:
         """Decrypt sensitive data"""
-        return self.encryption_key.decrypt(encrypted_data.encode()).decode()
+        return _FERNET.decrypt(encrypted_data)
 
-def generate_jwt_token(security_context: SecurityContext) -> str:
-    """Generate JWT token for authentication"""
+def _encode_jwt_token(user_id: str, roles: tuple, permissions: tuple) -> str:
     payload = {
-        "user_id": security_context.user_id,
-        "roles": security_context.roles,
-        "permissions": security_context.permissions,
-        "exp": datetime.utcnow() + timedelta(hours=1)
+        "user_id": user_id,
+        "roles": list(roles),
+        "permissions": list(permissions),
+        "exp": int((datetime.now(timezone.utc) + timedelta(hours=1)).timestamp())
     }
-    return jwt.encode(payload, TEST_JWT_SECRET, algorithm="HS256")
+    signing_input = _JWT_HEADER + b"." + _b64url(orjson.dumps(payload))
+    signer = _SIGNER.copy()
+    signer.update(signing_input)
+    return (signing_input + b"." + _b64url(signer.digest())).decode()
+
+def generate_jwt_token(security_context: SecurityContext) -> str:
+    """Generate JWT token for authentication"""
+    return _encode_jwt_token(
+        security_context.user_id,
+        tuple(security_context.roles),
+        tuple(security_context.permissions)
+    )
 
-async def setup_secure_environment():
+def setup_secure_environment():
     """Set up secure testing environment"""
     # Create SSL context
     ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
@@ -88,22 +112,39 @@ async def setup_secure_environment():
     
     return ssl_context, security_context
 
-async def test_authentication():
-    """Test authentication flow"""
-    logger = logging.getLogger("security_test")
-    agent_bus = AgentBus()
-    
-    # Set up secure environment
-    ssl_context, security_context = await setup_secure_environment()
-    
-    # Create secure agent
-    agent = SecureAgent(
+logger = logging.getLogger("security_test")
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture(scope="session")
+def secure_env():
+    """SSL and security contexts, built once for the whole session"""
+    return setup_secure_environment()
+
+def _build_secure_agent(agent_bus: AgentBus, security_context: SecurityContext) -> SecureAgent:
+    """Create the secure agent exercised by the security tests"""
+    return SecureAgent(
         "secure_agent",
         {"pipeline_id": "security_test"},
         logger,
         agent_bus,
         security_context
     )
+
+@pytest.fixture(scope="module")
+def agent_bus() -> AgentBus:
+    """Agent bus shared by the security tests in this module"""
+    return AgentBus()
+
+@pytest.fixture(scope="module")
+def secure_agent(agent_bus: AgentBus, secure_env) -> SecureAgent:
+    """Secure agent shared by the security tests in this module"""
+    _, security_context = secure_env
+    return _build_secure_agent(agent_bus, security_context)
+
+async def test_authentication(secure_env):
+    """Test authentication flow"""
+    ssl_context, security_context = secure_env
     
     # Test valid authentication
     try:
@@ -118,58 +159,28 @@ async def test_authentication():
         logger.error(f"Authentication test failed: {str(e)}")
         raise
 
-async def test_authorization():
+async def test_authorization(secure_agent: SecureAgent):
     """Test authorization boundaries"""
-    logger = logging.getLogger("security_test")
-    agent_bus = AgentBus()
-    
-    # Set up secure environment
-    _, security_context = await setup_secure_environment()
-    
-    # Create secure agent
-    agent = SecureAgent(
-        "secure_agent",
-        {"pipeline_id": "security_test"},
-        logger,
-        agent_bus,
-        security_context
-    )
-    
     # Test permission verification
     try:
         # Test with sufficient permissions
-        assert agent._verify_permissions(["read", "write"])
+        assert secure_agent._verify_permissions(["read", "write"])
         
         # Test with insufficient permissions
-        assert not agent._verify_permissions(["admin_override"])
+        assert not secure_agent._verify_permissions(["admin_override"])
         
         logger.info("Authorization test passed")
     except Exception as e:
         logger.error(f"Authorization test failed: {str(e)}")
         raise
 
-async def test_data_encryption():
+async def test_data_encryption(secure_agent: SecureAgent):
     """Test data encryption in transit"""
-    logger = logging.getLogger("security_test")
-    agent_bus = AgentBus()
-    
-    # Set up secure environment
-    _, security_context = await setup_secure_environment()
-    
-    # Create secure agent
-    agent = SecureAgent(
-        "secure_agent",
-        {"pipeline_id": "security_test"},
-        logger,
-        agent_bus,
-        security_context
-    )
-    
     # Test data encryption/decryption
     try:
-        test_data = "sensitive information"
-        encrypted = agent._encrypt_data(test_data)
-        decrypted = agent._decrypt_data(encrypted)
+        test_data = b"sensitive information"
+        encrypted = secure_agent._encrypt_data(test_data)
+        decrypted = secure_agent._decrypt_data(encrypted)
         
         assert test_data == decrypted
         assert encrypted != test_data
@@ -179,23 +190,8 @@ async def test_data_encryption():
         logger.error(f"Encryption test failed: {str(e)}")
         raise
 
-async def test_secure_message_flow():
+async def test_secure_message_flow(secure_agent: SecureAgent):
     """Test end-to-end secure message flow"""
-    logger = logging.getLogger("security_test")
-    agent_bus = AgentBus()
-    
-    # Set up secure environment
-    _, security_context = await setup_secure_environment()
-    
-    # Create secure agent
-    agent = SecureAgent(
-        "secure_agent",
-        {"pipeline_id": "security_test"},
-        logger,
-        agent_bus,
-        security_context
-    )
-    
     try:
         # Test task with sensitive data
         task_data = {
@@ -204,7 +200,7 @@ async def test_secure_message_flow():
             "required_permissions": ["read", "write"]
         }
         
-        result = await agent.execute_task(task_data, {})
+        result = await secure_agent.execute_task(task_data, {})
         
         # Verify sensitive data was encrypted
         assert "sensitive_data" in result
@@ -222,22 +218,24 @@ async def run_security_tests():
     
     try:
         logger.info("Starting security testing suite...")
+        secure_env = setup_secure_environment()
+        agent = _build_secure_agent(AgentBus(), secure_env[1])
         
         # Run authentication tests
         logger.info("\nTesting authentication...")
-        await test_authentication()
+        await test_authentication(secure_env)
         
         # Run authorization tests
         logger.info("\nTesting authorization...")
-        await test_authorization()
+        await test_authorization(agent)
         
         # Run encryption tests
         logger.info("\nTesting data encryption...")
-        await test_data_encryption()
+        await test_data_encryption(agent)
         
         # Run secure message flow tests
         logger.info("\nTesting secure message flow...")
-        await test_secure_message_flow()
+        await test_secure_message_flow(agent)
         
         logger.info("\nAll security tests completed successfully!")
         
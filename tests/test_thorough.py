@@ -1,11 +1,10 @@
 import asyncio
 import logging
-from datetime import datetime
+import pytest
 import sys
 import os
-import json
 from typing import List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -13,11 +12,15 @@ from src.agents.aethero_agent_bootstrap import BaseAetheroAgent
 from src.agents.error_handler import ErrorHandler, ErrorContext
 from src.agents.agent_bus import AgentBus, Message
 from src.monitoring.monitor import AetheroMonitor
+from tests._io import epoch_ns_str, cached_payload
 
 class StressTestAgent(BaseAetheroAgent):
+    # Looked up per call so a test can swap in a fake clock for this agent only
+    _sleep = staticmethod(asyncio.sleep)
+    
     async def process_task(self, task_data: Dict[str, Any], asl_context: Dict[str, Any]) -> Dict[str, Any]:
         # Simulate varying processing times and memory usage
-        await asyncio.sleep(task_data.get("processing_time", 0.1))
+        await self._sleep(task_data.get("processing_time", 0.1))
         
         # Simulate memory allocation
         memory_size = task_data.get("memory_size", 1000)
@@ -31,20 +34,20 @@ class StressTestAgent(BaseAetheroAgent):
             "result": f"Processed by {self.agent_id}",
             "task_data": task_data,
             "asl_context": asl_context,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": epoch_ns_str()
         }
 
 async def generate_large_payload(size_kb: int) -> Dict[str, Any]:
     """Generate a large message payload."""
     return {
-        "data": "x" * (size_kb * 1024),
+        "data": cached_payload(size_kb * 1024),
         "metadata": {
             "size": size_kb,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": epoch_ns_str()
         }
     }
 
-async def test_concurrent_processing(agent: StressTestAgent, num_tasks: int):
+async def _scenario_concurrent_processing(agent: StressTestAgent, num_tasks: int):
     """Test concurrent task processing."""
     tasks = []
     for i in range(num_tasks):
@@ -59,44 +62,56 @@ async def test_concurrent_processing(agent: StressTestAgent, num_tasks: int):
     results = await asyncio.gather(*tasks, return_exceptions=True)
     return [r for r in results if not isinstance(r, Exception)]
 
-async def test_large_messages(agent_bus: AgentBus, sizes_kb: List[int]):
+async def _scenario_large_messages(agent_bus: AgentBus, sizes_kb: List[int]):
     """Test handling of large message payloads."""
-    results = []
-    for size in sizes_kb:
-        payload = await generate_large_payload(size)
-        try:
-            await agent_bus.publish(
+    payloads = await asyncio.gather(*(generate_large_payload(size) for size in sizes_kb))
+    outcomes = await asyncio.gather(
+        *(
+            agent_bus.publish(
                 topic="large_message_test",
                 message=payload,
                 asl_tags={"size_kb": size}
             )
-            results.append({"size_kb": size, "status": "success"})
-        except Exception as e:
-            results.append({"size_kb": size, "status": "failed", "error": str(e)})
-    return results
+            for size, payload in zip(sizes_kb, payloads)
+        ),
+        return_exceptions=True
+    )
+    return [
+        {"size_kb": size, "status": "failed", "error": str(outcome)}
+        if isinstance(outcome, Exception)
+        else {"size_kb": size, "status": "success"}
+        for size, outcome in zip(sizes_kb, outcomes)
+    ]
 
-async def test_network_interruption(agent: StressTestAgent, agent_bus: AgentBus):
+async def _scenario_network_interruption(agent: StressTestAgent, agent_bus: AgentBus):
     """Test system behavior during network interruptions."""
+    # Exercise the delay path without waiting on the wall clock; only this
+    # scenario's publish and agent use the fake sleep, never the event loop
+    sleep_mock = AsyncMock(return_value=None)
+    
     # Simulate network delay
     original_publish = agent_bus.publish
     
     async def delayed_publish(*args, **kwargs):
-        await asyncio.sleep(2)  # Simulate network delay
+        await sleep_mock(2)  # Simulate network delay
         return await original_publish(*args, **kwargs)
     
     agent_bus.publish = delayed_publish
     
     try:
-        task_data = {"task_id": "network_test", "processing_time": 0.5}
-        asl_context = {"pipeline_id": "network_test"}
-        result = await agent.execute_task(task_data, asl_context)
+        with patch.object(agent, "_sleep", new=sleep_mock):
+            try:
+                task_data = {"task_id": "network_test", "processing_time": 0.5}
+                asl_context = {"pipeline_id": "network_test"}
+                result = await agent.execute_task(task_data, asl_context)
+            except Exception as e:
+                return {"status": "failed", "error": str(e)}
+        sleep_mock.assert_any_await(2)
         return {"status": "success", "result": result}
-    except Exception as e:
-        return {"status": "failed", "error": str(e)}
     finally:
         agent_bus.publish = original_publish
 
-async def test_multi_agent_workflow(num_agents: int, tasks_per_agent: int):
+async def _scenario_multi_agent_workflow(num_agents: int, tasks_per_agent: int):
     """Test complex multi-agent workflow scenarios."""
     agents = []
     agent_bus = AgentBus()
@@ -111,15 +126,15 @@ async def test_multi_agent_workflow(num_agents: int, tasks_per_agent: int):
         )
         agents.append(agent)
     
-    # Create workflow
-    results = []
-    for agent in agents:
-        agent_results = await test_concurrent_processing(agent, tasks_per_agent)
-        results.extend(agent_results)
-    
-    return results
+    # Create workflow; agents run their task batches concurrently
+    async with asyncio.TaskGroup() as tg:
+        futs = [
+            tg.create_task(_scenario_concurrent_processing(agent, tasks_per_agent), name=agent.agent_id)
+            for agent in agents
+        ]
+    return [r for f in futs for r in f.result()]
 
-async def test_system_recovery():
+async def _scenario_system_recovery():
     """Test system recovery after failures."""
     agent_bus = AgentBus()
     monitor = AetheroMonitor()
@@ -147,9 +162,34 @@ async def test_system_recovery():
     
     return results
 
+# Each scenario of run_thorough_tests, runnable on its own so workers can split them
+THOROUGH_SCENARIOS = {
+    "concurrent_processing": lambda agent, agent_bus: _scenario_concurrent_processing(agent, 10),
+    "large_messages": lambda agent, agent_bus: _scenario_large_messages(agent_bus, [1, 10, 100]),
+    "network_interruption": lambda agent, agent_bus: _scenario_network_interruption(agent, agent_bus),
+    "multi_agent_workflow": lambda agent, agent_bus: _scenario_multi_agent_workflow(3, 5),
+    "system_recovery": lambda agent, agent_bus: _scenario_system_recovery(),
+}
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scenario", list(THOROUGH_SCENARIOS))
+async def test_thorough_scenario(scenario: str):
+    """Run a single thorough-test scenario against fresh components."""
+    agent_bus = AgentBus()
+    agent = StressTestAgent(
+        "stress_test_agent",
+        {"pipeline_id": "thorough_test"},
+        logging.getLogger("thorough_tests"),
+        agent_bus
+    )
+    results = await THOROUGH_SCENARIOS[scenario](agent, agent_bus)
+    if isinstance(results, dict):
+        results = [results]
+    assert results
+    assert all(r.get("status") != "failed" for r in results), results
+
 async def run_thorough_tests():
     """Run all thorough tests."""
-    logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger("thorough_tests")
     
     try:
@@ -170,31 +210,31 @@ async def run_thorough_tests():
         
         # 1. Test concurrent processing
         logger.info("\nTesting concurrent processing...")
-        concurrent_results = await test_concurrent_processing(agent, 10)
+        concurrent_results = await _scenario_concurrent_processing(agent, 10)
         logger.info(f"Concurrent processing results: {len(concurrent_results)} tasks completed")
         
         # 2. Test large messages
         logger.info("\nTesting large message handling...")
-        message_results = await test_large_messages(agent_bus, [1, 10, 100])
-        logger.info(f"Large message results: {json.dumps(message_results, indent=2)}")
+        message_results = await _scenario_large_messages(agent_bus, [1, 10, 100])
+        logger.info("Large message results: %s", message_results)
         
         # 3. Test network interruption handling
         logger.info("\nTesting network interruption handling...")
-        network_result = await test_network_interruption(agent, agent_bus)
-        logger.info(f"Network interruption test result: {json.dumps(network_result, indent=2)}")
+        network_result = await _scenario_network_interruption(agent, agent_bus)
+        logger.info("Network interruption test result: %s", network_result)
         
         # 4. Test multi-agent workflow
         logger.info("\nTesting multi-agent workflow...")
-        workflow_results = await test_multi_agent_workflow(3, 5)
+        workflow_results = await _scenario_multi_agent_workflow(3, 5)
         logger.info(f"Multi-agent workflow results: {len(workflow_results)} total tasks completed")
         
         # 5. Test system recovery
         logger.info("\nTesting system recovery...")
-        recovery_results = await test_system_recovery()
-        logger.info(f"Recovery test results: {json.dumps(recovery_results, indent=2)}")
+        recovery_results = await _scenario_system_recovery()
+        logger.info("Recovery test results: %s", recovery_results)
         
         # Stop monitoring
-        monitor.running = False
+        monitor.stop()
         await monitor_task
         
         logger.info("\nAll thorough tests completed successfully!")
@@ -204,4 +244,5 @@ async def run_thorough_tests():
         raise
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(run_thorough_tests())
@@ -1,5 +1,14 @@
+import logging
+
 import yaml
 
+try:
+    from yaml import CDumper as _Dumper
+except ImportError:
+    from yaml import Dumper as _Dumper
+
+logger = logging.getLogger(__name__)
+
 def save_yaml_output(data, output_path):
     """
     Save data to a YAML file.
@@ -9,5 +18,5 @@ def save_yaml_output(data, output_path):
         output_path (str): The path to the output YAML file.
     """
     with open(output_path, "w", encoding="utf-8") as file:
-        yaml.dump(data, file, default_flow_style=False, allow_unicode=True)
-    print(f"[✓] YAML output saved to {output_path}")
+        yaml.dump(data, file, Dumper=_Dumper, default_flow_style=False, allow_unicode=True)
+    logger.info("[✓] YAML output saved to %s", output_path)
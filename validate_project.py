@@ -10,12 +10,14 @@ expected_structure = {
 # Overenie štruktúry
 def validate_structure():
     for folder, files in expected_structure.items():
-        if folder and not os.path.exists(folder):
+        try:
+            with os.scandir(folder or ".") as it:
+                entries = {entry.name for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
             return f"Missing folder: {folder}"
         for file in files:
-            file_path = os.path.join(folder, file) if folder else file
-            if not os.path.exists(file_path):
-                return f"Missing file: {file_path}"
+            if file not in entries:
+                return f"Missing file: {os.path.join(folder, file) if folder else file}"
     return "Structure is valid!"
 
 # Spustenie validácie